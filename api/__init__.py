@@ -0,0 +1,4 @@
+from .osv_client import OSVClient
+
+
+__all__ = ['OSVClient']
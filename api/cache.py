@@ -0,0 +1,106 @@
+"""
+On-disk cache of positive OSV lookups.
+
+Only packages that HAVE vulnerabilities are cached. A negative result is
+never stored, so a newly disclosed CVE is picked up on the very next scan.
+
+Java equivalent: a Caffeine/Ehcache cache backed by a local file store.
+"""
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+# Relative to the user's home directory, resolved when the cache is opened
+DEFAULT_CACHE_PATH = Path('.cache') / 'vuln-scanner' / 'osv-positive.db'
+
+# Cached entries older than this are ignored and refetched
+DEFAULT_MAX_AGE_SECS = 86400
+
+
+class VulnCache:
+    """
+    Persistent (ecosystem, name, version) -> vulnerabilities cache.
+
+    Java equivalent:
+    public class VulnCache {
+        public Optional<List<Vulnerability>> get(String ecosystem, String name, String version);
+        public void put(String ecosystem, String name, String version, List<Vulnerability> vulns);
+    }
+    """
+
+    def __init__(self, path=None, max_age_secs=DEFAULT_MAX_AGE_SECS):
+        self.max_age_secs = max_age_secs
+
+        path = Path(path) if path else Path.home() / DEFAULT_CACHE_PATH
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        # The client may be shared between threads, so guard the connection
+        # Java: synchronized (lock) { ... }
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(str(path), check_same_thread=False)
+        self.conn.execute(
+            'CREATE TABLE IF NOT EXISTS vulns ('
+            'key TEXT PRIMARY KEY, value TEXT NOT NULL, stored_at REAL NOT NULL)'
+        )
+
+    @classmethod
+    def open(cls, **kwargs):
+        """
+        Open the cache, or return None if that isn't possible.
+
+        The cache is only an optimization, so a read-only or missing home
+        directory (common in CI containers) must not abort the scan.
+
+        Java: try { return new VulnCache(); } catch (IOException e) { return null; }
+        """
+        try:
+            return cls(**kwargs)
+        except (OSError, RuntimeError, sqlite3.Error):
+            # RuntimeError: Path.home() couldn't work out a home directory
+            return None
+
+    @staticmethod
+    def make_key(ecosystem, name, version):
+        return f"{ecosystem}|{name}|{version}"
+
+    def get(self, ecosystem, name, version):
+        """Return the cached vulnerability list, or None on a miss."""
+        try:
+            with self.lock:
+                row = self.conn.execute(
+                    'SELECT value, stored_at FROM vulns WHERE key = ?',
+                    (self.make_key(ecosystem, name, version),)
+                ).fetchone()
+        except sqlite3.Error:
+            # A locked or corrupt database is treated as a miss
+            return None
+
+        if row is None or time.time() - row[1] > self.max_age_secs:
+            return None
+        return json.loads(row[0])
+
+    def put(self, ecosystem, name, version, vulns):
+        """
+        Store a positive result. Empty results are ignored.
+
+        Expired rows are purged here too, so the file doesn't grow forever.
+        """
+        if not vulns:
+            return
+
+        now = time.time()
+        try:
+            with self.lock, self.conn:
+                self.conn.execute(
+                    'DELETE FROM vulns WHERE stored_at < ?',
+                    (now - self.max_age_secs,)
+                )
+                self.conn.execute(
+                    'INSERT OR REPLACE INTO vulns (key, value, stored_at) VALUES (?, ?, ?)',
+                    (self.make_key(ecosystem, name, version), json.dumps(vulns), now)
+                )
+        except sqlite3.Error:
+            # e.g. a read-only database file - skip caching, keep scanning
+            pass
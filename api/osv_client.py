@@ -0,0 +1,214 @@
+"""
+OSV API client - talks to https://osv.dev to look up known vulnerabilities.
+
+Java equivalent:
+@Component
+public class OsvClient {
+    private final RestTemplate restTemplate;
+    ...
+}
+"""
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .cache import VulnCache
+
+OSV_API_URL = 'https://api.osv.dev/v1'
+
+# OSV accepts at most 1000 queries per querybatch request
+BATCH_SIZE = 1000
+
+# Number of concurrent vulnerability detail lookups
+MAX_WORKERS = 16
+
+# One keep-alive Session for the whole process, so every OSVClient reuses
+# the same TCP/TLS connections instead of paying a handshake per request.
+# OSV queries are read-only, so retrying POSTs on transient errors is safe.
+# Java: a static pooled CloseableHttpClient with a retry handler
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(
+    pool_connections=1,
+    pool_maxsize=32,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.2,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset({'GET', 'POST'})
+    )
+))
+
+class OSVClient:
+    """
+    Client for the OSV (Open Source Vulnerabilities) database.
+
+    Java equivalent:
+    public class OsvClient {
+        public List<List<Vulnerability>> checkBatch(List<Dependency> deps);
+    }
+    """
+
+    def __init__(self, timeout=30, use_cache=True):
+        self.timeout = timeout
+
+        # Positive hits are cached on disk between runs (see api/cache.py).
+        # open() returns None if the cache can't be created, e.g. read-only $HOME
+        self.cache = VulnCache.open() if use_cache else None
+
+        # Shared, pooled connection (see _SESSION above)
+        self.session = _SESSION
+
+    def check_batch(self, dependencies, progress=None, fail_fast=False):
+        """
+        Check many dependencies at once using the OSV querybatch endpoint.
+
+        The batch endpoint only returns vulnerability IDs, so details are
+        fetched afterwards - but only for the IDs that were actually found.
+        Callers should deduplicate first (scanner.scan_files does); repeated
+        entries are still answered correctly but are queried more than once.
+
+        Args:
+            dependencies (list): Dependency objects with name, version, ecosystem
+            progress (callable): Optional progress(done, total) callback,
+                                 called as vulnerability details arrive
+            fail_fast (bool): Stop at the first vulnerable dependency, in
+                              input order. Only that one gets details; every
+                              other entry is returned as an empty list.
+
+        Returns:
+            list: One list of vulnerability dictionaries per dependency,
+                  in the same order as the input
+        """
+        found = {}
+
+        # Step 0: answer what we can from the on-disk cache
+        if self.cache:
+            for dep in dependencies:
+                cached = self.cache.get(*dep.key)
+                if cached is not None:
+                    found[dep.key] = cached
+
+        if fail_fast and found:
+            # The cache only holds positive hits, so only dependencies listed
+            # before the first cached hit could be an earlier vulnerable one
+            first_cached = next(i for i, dep in enumerate(dependencies) if dep.key in found)
+            pending_deps = dependencies[:first_cached]
+        else:
+            pending_deps = [dep for dep in dependencies if dep.key not in found]
+
+        # Step 1: one POST per ecosystem (per 1000 dependencies) to find
+        # vulnerability IDs
+        by_ecosystem = {}
+        for dep in pending_deps:
+            by_ecosystem.setdefault(dep.ecosystem, []).append(dep)
+
+        hits = []
+        for deps in by_ecosystem.values():
+            for start in range(0, len(deps), BATCH_SIZE):
+                chunk = deps[start:start + BATCH_SIZE]
+                hits.extend((dep, ids) for dep, ids in zip(chunk, self._query_batch(chunk)) if ids)
+
+        if fail_fast:
+            # Keep only the vulnerable dependency that comes first in the input,
+            # whether it was answered by the cache or by OSV
+            vulnerable = set(found) | {dep.key for dep, _ in hits}
+            first_key = next((dep.key for dep in dependencies if dep.key in vulnerable), None)
+            found = {key: vulns for key, vulns in found.items() if key == first_key}
+            hits = [(dep, ids) for dep, ids in hits if dep.key == first_key][:1]
+
+        # Step 2: fetch details for each distinct ID concurrently
+        # Java: executor.invokeAll(tasks) with a fixed thread pool
+        unique_ids = list(dict.fromkeys(vid for _, ids in hits for vid in ids))
+        details = {}
+        if unique_ids:
+            with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+                fetched = executor.map(self._get_vulnerability, unique_ids)
+                for done, (vuln_id, vuln) in enumerate(zip(unique_ids, fetched), 1):
+                    details[vuln_id] = self._format_vulnerability(vuln)
+                    if progress:
+                        progress(done, len(unique_ids))
+
+        for dep, ids in hits:
+            vulns = [details[vid] for vid in ids]
+            found[dep.key] = vulns
+            if self.cache:
+                self.cache.put(*dep.key, vulns)
+
+        return [found.get(dep.key, []) for dep in dependencies]
+
+    def _query_batch(self, dependencies):
+        """
+        Return the list of vulnerability IDs for each dependency.
+
+        OSV paginates each result: when a package has many advisories, its
+        result carries a next_page_token and only the first page of IDs.
+        Those packages are re-queried page by page so no advisory is lost.
+        """
+        results = self._post_queries([self._make_query(dep) for dep in dependencies])
+
+        # A short answer would silently report the missing packages as clean
+        if len(results) != len(dependencies):
+            raise ValueError(
+                f"OSV returned {len(results)} results for {len(dependencies)} queries"
+            )
+
+        vuln_ids = []
+        for dep, result in zip(dependencies, results):
+            ids = [v['id'] for v in result.get('vulns', [])]
+
+            # Java: while (token != null) { ... token = page.getNextPageToken(); }
+            page_token = result.get('next_page_token')
+            while page_token:
+                (page,) = self._post_queries([self._make_query(dep, page_token)])
+                ids.extend(v['id'] for v in page.get('vulns', []))
+                page_token = page.get('next_page_token')
+
+            vuln_ids.append(list(dict.fromkeys(ids)))
+        return vuln_ids
+
+    @staticmethod
+    def _make_query(dep, page_token=None):
+        """Build one querybatch entry, optionally asking for a later page."""
+        query = {
+            'package': {'name': dep.name, 'ecosystem': dep.ecosystem},
+            'version': dep.version
+        }
+        if page_token:
+            query['page_token'] = page_token
+        return query
+
+    def _post_queries(self, queries):
+        """POST /v1/querybatch and return its results list."""
+        response = self.session.post(
+            f'{OSV_API_URL}/querybatch', json={'queries': queries}, timeout=self.timeout
+        )
+        response.raise_for_status()
+        return response.json().get('results', [])
+
+    def _get_vulnerability(self, vuln_id):
+        """Fetch the full record for a single vulnerability ID."""
+        response = self.session.get(f'{OSV_API_URL}/vulns/{vuln_id}', timeout=self.timeout)
+        response.raise_for_status()
+        return response.json()
+
+    @staticmethod
+    def _format_vulnerability(vuln):
+        """
+        Reduce a raw OSV record to the fields the reports use.
+
+        Severity comes from the advisory database when available
+        (e.g., GitHub advisories use LOW/MODERATE/HIGH/CRITICAL).
+        """
+        severity = vuln.get('database_specific', {}).get('severity')
+        if not severity and vuln.get('severity'):
+            severity = vuln['severity'][0].get('score')
+
+        return {
+            'id': vuln.get('id', 'UNKNOWN'),
+            'summary': vuln.get('summary', ''),
+            'severity': severity or 'UNKNOWN',
+            'aliases': vuln.get('aliases', []),
+            'published': vuln.get('published', '')
+        }
@@ -1,9 +1,10 @@
+from .base import BaseParser, Dependency
 from .requirements import RequirementsParser
 from .pom import PomParser
 
 
 # Export these for easy importing
-__all__ = ['RequirementsParser', 'PomParser']
+__all__ = ['BaseParser', 'Dependency', 'RequirementsParser', 'PomParser']
 
 """
 Parsers for different dependency file formats.
@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict
 from pathlib import Path
+from typing import ClassVar
 
 """
 Base Parser - Abstract class for all dependency parsers.
@@ -11,8 +11,38 @@ public abstract class BaseParser {
 }
 """
 
+class Dependency:
+    """
+    A single package pinned to a specific version.
+
+    Java equivalent:
+    public record Dependency(String name, String version, String ecosystem) {}
+
+    __slots__ tells Python not to give each instance a __dict__, which keeps
+    these small objects compact when a file has hundreds of dependencies.
+    """
+    __slots__ = ('name', 'version', 'ecosystem')
+
+    def __init__(self, name, version, ecosystem):
+        self.name = name
+        self.version = version
+        self.ecosystem = ecosystem
+
+    def __repr__(self):
+        return f"Dependency({self.name!r}, {self.version!r}, {self.ecosystem!r})"
+
+    @property
+    def key(self):
+        """(ecosystem, name, version) - identifies the same package version across files."""
+        return (self.ecosystem, self.name, self.version)
+
+    def to_dict(self):
+        """Plain dictionary form, used by the JSON and HTML reports."""
+        return {'name': self.name, 'version': self.version, 'ecosystem': self.ecosystem}
+
+
 class BaseParser(ABC):
-     """
+    """
     Abstract base class for dependency parsers.
     
     In Java, you'd use either an interface or abstract class:
@@ -22,19 +52,23 @@ class BaseParser(ABC):
     
     In Python, we use ABC (Abstract Base Class) from the abc module.
     """
+    # OSV ecosystem for every dependency this parser produces (e.g., 'PyPI')
+    # Java: protected static final String ECOSYSTEM; set by each subclass
+    ECOSYSTEM: ClassVar[str]
+
     @abstractmethod
-    def parse(self, filepath) 
-    """
+    def parse(self, filepath) -> list[Dependency]:
+        """
         Parse dependencies from a file.
         
         Args:
             filepath (str): Path to dependency file
             
         Returns:
-            list: List of dependency dictionaries with keys:
+            list: List of Dependency objects with attributes:
                   - name: package name
                   - version: package version
-                  - ecosystem: package ecosystem (pip, maven, etc.)
+                  - ecosystem: package ecosystem (PyPI, Maven, etc.)
         
         Java equivalent:
         public abstract List<Dependency> parse(String filepath) 
@@ -42,13 +76,17 @@ class BaseParser(ABC):
         """
         pass
 
-    def read_file(self, filepath):
+    def open_text(self, filepath):
         """
-        Helper method to read file contents.
+        Helper method to open a dependency file for streaming reads.
+        
+        Returns an open text file, which iterates line by line and can be
+        handed straight to streaming parsers - the whole file is never
+        held in memory at once. Use it in a "with" block so it gets closed.
         
         Java equivalent:
-        protected String readFile(String filepath) throws IOException {
-            return Files.readString(Path.of(filepath));
+        protected BufferedReader openText(String filepath) throws IOException {
+            return Files.newBufferedReader(Path.of(filepath));
         }
         """
         # Path is like Java NIO's Path
@@ -59,6 +97,6 @@ class BaseParser(ABC):
             # Raise exception (like throw new FileNotFoundException())
             raise FileNotFoundError(f"File not found: {filepath}")
         
-        # Read entire file as string
-        # Java: return Files.readString(path);
-        return path.read_text()
\ No newline at end of file
+        # 1 MiB read buffer; undecodable bytes become U+FFFD instead of failing
+        # Java: new BufferedReader(new InputStreamReader(in, UTF_8), 1 << 20)
+        return path.open('r', buffering=1 << 20, encoding='utf-8', errors='replace')
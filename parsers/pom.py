@@ -0,0 +1,94 @@
+import re
+import xml.etree.ElementTree as ET
+
+from .base import BaseParser, Dependency
+
+"""
+POM Parser - reads Maven pom.xml files.
+
+Java equivalent: what Maven itself does when it builds the dependency tree,
+minus parent POMs, BOM imports and transitive resolution.
+"""
+
+# Precompiled patterns, built once at import time
+# Java: private static final Pattern PROPERTY = Pattern.compile(...);
+_PROPERTY_RE = re.compile(r'\$\{([^}]+)\}')
+_NS_PREFIX_RE = re.compile(r'^\{[^}]*\}')
+
+
+def _local_name(tag):
+    """
+    Strip the namespace from an ElementTree tag.
+
+    Most POMs declare xmlns="http://maven.apache.org/POM/4.0.0", which makes
+    tags look like "{http://...}dependency", but the namespace is optional.
+    Comparing local names handles both.
+    """
+    return _NS_PREFIX_RE.sub('', tag)
+
+
+class PomParser(BaseParser):
+    """
+    Parser for Maven pom.xml files.
+
+    Dependencies are reported as "groupId:artifactId", which is the package
+    name format OSV uses for the Maven ecosystem. Versions written as
+    ${property} are resolved from the POM's <properties> section.
+
+    The file is streamed with iterparse (like a StAX XMLStreamReader in Java)
+    and each <dependency> is cleared once read, so memory stays flat no
+    matter how large the POM is.
+
+    Java equivalent:
+    public class PomParser extends BaseParser {
+        @Override
+        public List<Dependency> parse(String filepath) { ... }
+    }
+    """
+
+    ECOSYSTEM = 'Maven'
+
+    def parse(self, filepath):
+        properties = {}
+        raw_dependencies = []
+
+        # Track the element path so we only pick up <project><dependencies>,
+        # not <dependencyManagement> or plugin dependencies
+        stack = []
+        with self.open_text(filepath) as source:
+            for event, elem in ET.iterparse(source, events=('start', 'end')):
+                if event == 'start':
+                    stack.append(_local_name(elem.tag))
+                    continue
+
+                depth = len(stack)
+                parent = stack[-2] if depth >= 2 else None
+
+                if depth == 3 and parent == 'dependencies' and stack[-1] == 'dependency':
+                    fields = {_local_name(child.tag): (child.text or '').strip() for child in elem}
+                    raw_dependencies.append((
+                        fields.get('groupId', ''),
+                        fields.get('artifactId', ''),
+                        fields.get('version', '')
+                    ))
+                    elem.clear()
+                elif depth == 3 and parent == 'properties':
+                    properties[stack[-1]] = (elem.text or '').strip()
+                elif depth == 2:
+                    # Done with a top-level section - free its subtree
+                    elem.clear()
+
+                stack.pop()
+
+        # Properties may be declared after the dependencies, so resolve last
+        dependencies = []
+        for group_id, artifact_id, version in raw_dependencies:
+            version = _PROPERTY_RE.sub(lambda m: properties.get(m.group(1), m.group(0)), version)
+
+            # Versions managed elsewhere (parent POM, BOM) can't be checked
+            if not group_id or not artifact_id or not version or '${' in version:
+                continue
+
+            dependencies.append(Dependency(f"{group_id}:{artifact_id}", version, self.ECOSYSTEM))
+
+        return dependencies
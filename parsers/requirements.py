@@ -0,0 +1,67 @@
+import re
+
+from .base import BaseParser, Dependency
+
+"""
+Requirements Parser - reads Python requirements.txt files.
+
+Java equivalent: a parser for a Maven-style dependency list, but for pip.
+"""
+
+# Compile the pattern once at import time instead of on every line
+# Java: private static final Pattern REQ_PATTERN = Pattern.compile(...);
+#
+# Matches lines like:  requests==2.31.0   Django[bcrypt] >= 4.2   numpy~=1.26
+# The version must end at whitespace, ';' (environment marker), ',' (another
+# specifier), '\' (line continuation) or end of line, so "1.*" and "1!2.0"
+# are captured whole instead of being cut short at the first odd character.
+_REQ_RE = re.compile(
+    r'^\s*([A-Za-z0-9_.\-]+)(?:\[[^\]]*\])?\s*([<>=!~]=?)\s*([0-9A-Za-z.\-+!*]+)(?=[\s;,\\]|$)'
+)
+
+
+class RequirementsParser(BaseParser):
+    """
+    Parser for pip requirements.txt files.
+
+    Only pinned dependencies (name==version) are reported, because OSV
+    needs an exact version to tell whether a package is affected.
+
+    Java equivalent:
+    public class RequirementsParser extends BaseParser {
+        @Override
+        public List<Dependency> parse(String filepath) { ... }
+    }
+    """
+
+    ECOSYSTEM = 'PyPI'
+
+    def parse(self, filepath):
+        dependencies = []
+        with self.open_text(filepath) as lines:
+            for line in lines:
+                # Cheap first-character check before touching the regex engine:
+                # skips blank lines, comments, and options like "-r other.txt"
+                # or "--hash=sha256:..." continuation lines
+                stripped = line.lstrip()
+                if not stripped or stripped[0] in '#-':
+                    continue
+
+                # Strip inline comments: "requests==2.31.0  # HTTP client"
+                if '#' in stripped:
+                    stripped = stripped.split('#', 1)[0]
+
+                match = _REQ_RE.match(stripped)
+                if not match:
+                    # URLs, local paths and other lines we can't pin
+                    continue
+
+                name, operator, version = match.groups()
+                if operator != '==' or '*' in version:
+                    # Ranges like ">=1.0" or wildcards like "==1.*" don't pin
+                    # a version we can look up
+                    continue
+
+                dependencies.append(Dependency(name, version, self.ECOSYSTEM))
+
+        return dependencies
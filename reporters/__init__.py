@@ -0,0 +1,4 @@
+from .report import ReportGenerator
+
+
+__all__ = ['ReportGenerator']
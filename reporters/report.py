@@ -0,0 +1,117 @@
+import json
+from datetime import datetime
+
+from jinja2 import Environment
+
+# orjson is optional: it's a much faster JSON encoder that writes UTF-8
+# bytes directly. Fall back to the standard library when it isn't installed.
+# Java: like picking Jackson's Afterburner module only if it's on the classpath
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+"""
+Report Generator - turns scan results into JSON or HTML reports.
+
+Java equivalent: a @Service that uses Jackson for JSON and Thymeleaf for HTML.
+"""
+
+HTML_TEMPLATE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+  <meta charset="utf-8">
+  <title>Vulnerability Report</title>
+  <style>
+    body { font-family: sans-serif; margin: 2em; }
+    table { border-collapse: collapse; width: 100%; margin-bottom: 2em; }
+    th, td { border: 1px solid #ccc; padding: 6px 10px; text-align: left; }
+    th { background: #f4f4f4; }
+    .CRITICAL, .HIGH { color: #b00020; font-weight: bold; }
+    .MODERATE, .MEDIUM { color: #c77700; }
+  </style>
+</head>
+<body>
+  <h1>Vulnerability Report</h1>
+  <p>Generated {{ generated_at }}</p>
+  <p>Files scanned: {{ summary.files_scanned }}</p>
+  <p>Total packages scanned: {{ summary.total_packages }}</p>
+  <p>Vulnerable packages: {{ summary.vulnerable_packages }}</p>
+  <p>Total vulnerabilities: {{ summary.total_vulnerabilities }}</p>
+  {% if summary.stopped_early %}
+  <p><strong>Stopped at the first vulnerable package (--fail-fast);
+     packages after it were not fully checked.</strong></p>
+  {% endif %}
+  {% for result in results %}
+  <h2>{{ result.dependency.name }}@{{ result.dependency.version }}</h2>
+  <p>Found in: {{ result.files|join(', ') }}</p>
+  <table>
+    <tr><th>ID</th><th>Severity</th><th>Summary</th></tr>
+    {% for vuln in result.vulnerabilities %}
+    <tr>
+      <td><a href="https://osv.dev/vulnerability/{{ vuln.id }}">{{ vuln.id }}</a></td>
+      <td class="{{ vuln.severity }}">{{ vuln.severity }}</td>
+      <td>{{ vuln.summary }}</td>
+    </tr>
+    {% endfor %}
+  </table>
+  {% endfor %}
+</body>
+</html>
+"""
+
+
+class ReportGenerator:
+    """
+    Generates reports from scan results.
+
+    Java equivalent:
+    public class ReportGenerator {
+        public byte[] generateJson(List<ScanResult> results, ScanSummary summary);
+        public Stream<String> generateHtml(List<ScanResult> results, ScanSummary summary);
+    }
+    """
+
+    def __init__(self):
+        # autoescape protects against HTML in advisory summaries
+        self.env = Environment(autoescape=True)
+
+    def generate_json(self, results, summary):
+        """
+        Render results as UTF-8 encoded JSON bytes.
+
+        The summary (counts and the --fail-fast 'stopped_early' flag) goes in
+        too, so a consumer can tell a clean scan from one that stopped early.
+        """
+        report = {
+            'generated_at': datetime.now().isoformat(timespec='seconds'),
+            'summary': summary,
+            'results': [
+                {
+                    'dependency': r['dependency'].to_dict(),
+                    'files': r['files'],
+                    'vulnerabilities': r['vulnerabilities']
+                }
+                for r in results
+            ]
+        }
+        if orjson:
+            return orjson.dumps(report, option=orjson.OPT_INDENT_2)
+        return json.dumps(report, indent=2, ensure_ascii=False).encode('utf-8')
+
+    def generate_html(self, results, summary):
+        """
+        Render results as an HTML page.
+
+        Returns a Jinja2 TemplateStream rather than one big string: call
+        stream.dump(file) to write the page piece by piece, so memory use
+        doesn't grow with the size of the report.
+
+        Java equivalent: templateEngine.process(template, context, writer)
+        """
+        template = self.env.from_string(HTML_TEMPLATE)
+        return template.stream(
+            results=results,
+            summary=summary,
+            generated_at=datetime.now().isoformat(timespec='seconds')
+        )
@@ -1,13 +1,13 @@
 import argparse
+import functools
+import signal
 import sys
 from pathlib import Path
 
-# In Python, we import from our own packages like this
-# Java equivalent: import com.company.parsers.RequirementsParser;
-from parsers.requirements import RequirementsParser
-from parsers.pom import PomParser
-from api.osv_client import OSVClient
-from reporters.report import ReportGenerator
+# Our own packages (parsers, api, reporters) are imported inside the
+# functions that use them, so "--help" or a bad argument doesn't pay for
+# loading requests, jinja2, etc.
+# Java equivalent: lazy initialization with a Supplier or @Lazy bean
 
 def parse_arguments():
     """
@@ -19,7 +19,12 @@ def parse_arguments():
     """
     parser = argparse.ArgumentParser(description='Scan dependencies for vulnerabilities')
 
-    parser.add_argument('--file', required=True, help='Path to the dependency file (e.g., requirements.txt or pom.xml)')
+    parser.add_argument(
+        '--file',
+        required=True,
+        nargs='+',
+        help='Path to one or more dependency files (e.g., requirements.txt or pom.xml)'
+    )
 
     parser.add_argument(
         '--format',
@@ -33,10 +38,33 @@ def parse_arguments():
         help='Output file path (default: print to console)'
     )
     
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Ignore the on-disk cache of known vulnerable packages'
+    )
+    
+    parser.add_argument(
+        '--fail-fast',
+        action='store_true',
+        help='Stop at the first vulnerable package (useful for pre-commit hooks)'
+    )
+    
     # Parse and return
     # Java: CommandLine cmd = parser.parse(options, args);
     return parser.parse_args()
 
+# File name -> file type. Add an entry here (and a parser in get_parser)
+# to support a new ecosystem.
+# Java: private static final Map<String, FileType> FILE_TYPES = Map.of(...);
+FILE_TYPES = {
+    'requirements.txt': 'requirements',
+    'pom.xml': 'pom'
+}
+
+# Results depend only on the input string, so remember them
+# Java: like a @Cacheable method with a small bounded cache
+@functools.lru_cache(maxsize=32)
 def detect_file_type(filepath):
     """
     Detect what type of dependency file this is.
@@ -50,17 +78,17 @@ def detect_file_type(filepath):
     }
     """
     # Path is like Java's java.nio.file.Path
-    path = Path(filepath)
+    name = Path(filepath).name
     
-    # String comparison (Python strings are objects with methods)
-    if path.name == 'requirements.txt':
-        return 'requirements'
-    elif path.name == 'pom.xml':
-        return 'pom'
-    else:
+    # One hashed lookup instead of a growing if/elif chain
+    file_type = FILE_TYPES.get(name)
+    if file_type is None:
         # Raise exception (like throw new IllegalArgumentException())
-        raise ValueError(f"Unknown file type: {path.name}")
+        raise ValueError(f"Unknown file type: {name}")
+    return file_type
 
+# Parsers are stateless, so one instance per file type can be reused
+@functools.lru_cache(maxsize=32)
 def get_parser(file_type):
     """
     Factory method to get the right parser.
@@ -74,6 +102,11 @@ def get_parser(file_type):
         }
     }
     """
+    # In Python, we import from our own packages like this
+    # Java equivalent: import com.company.parsers.RequirementsParser;
+    from parsers.requirements import RequirementsParser
+    from parsers.pom import PomParser
+    
     # Dictionary as switch statement (Python has no switch until 3.10)
     # Java: Map<String, Supplier<Parser>> parsers = Map.of(...)
     parsers = {
@@ -89,57 +122,124 @@ def get_parser(file_type):
     
     return parser_class()
 
-def scan_dependencies(filepath):
+def show_progress(done, total):
     """
-    Main scanning logic.
+    Progress callback for long-running OSV lookups.
+    
+    Redraws a single line with a carriage return, and only when stdout is
+    a terminal - piped output (CI logs, files) gets no per-item noise.
+    """
+    if not sys.stdout.isatty():
+        return
+    
+    # Writing on every item would cost a syscall each time; every 10th is plenty
+    if done % 10 == 0 or done == total:
+        sys.stdout.write(f"\r  Fetching vulnerability details [{done}/{total}]")
+        if done == total:
+            sys.stdout.write("\n")
+        sys.stdout.flush()
+
+def parse_file(filepath):
+    """
+    Detect the file type and parse its dependencies.
+    
+    Java equivalent: return getParser(detectFileType(filepath)).parse(filepath);
+    """
+    file_type = detect_file_type(filepath)
+    parser = get_parser(file_type)
+    return parser.parse(filepath)
+
+def scan_files(filepaths, use_cache=True, fail_fast=False, progress=show_progress):
+    """
+    Main scanning logic, for one or more dependency files.
+    
+    1. Files are parsed one after another, in the order given. Parsing is
+       CPU-bound, so threads wouldn't speed it up (the GIL runs one at a time).
+    2. Dependencies are deduplicated across all files, remembering which
+       file(s) each one came from.
+    3. Everything is checked with a single OSV batch lookup.
+    
+    Returns a (results, summary) tuple, or None if no file had any
+    dependencies. Each result holds the dependency, its vulnerabilities and
+    the files it was found in; summary holds the counts.
+    With fail_fast=True, results stop at the first vulnerable package.
     
     This is like a service method in Spring Boot:
     @Service
     public class ScanService {
-        public ScanResult scan(String filepath) { ... }
+        public ScanResult scan(List<String> filepaths) { ... }
     }
     """
-    print(f"📁 Scanning: {filepath}\n")
+    # "--file a b a" names the same file twice; scan it once, keeping order
+    # Java: new ArrayList<>(new LinkedHashSet<>(filepaths))
+    filepaths = list(dict.fromkeys(filepaths))
     
-    # Detect file type and get appropriate parser
-    file_type = detect_file_type(filepath)
-    parser = get_parser(file_type)
+    # Step 1: parse each file in order
+    parsed = {}
+    for path in filepaths:
+        parsed[path] = parse_file(path)
+        print(f"📁 Scanned {path}: {len(parsed[path])} dependencies")
+    print()
     
-    # Parse dependencies from file
-    # Java: List<Dependency> deps = parser.parse(filepath);
-    dependencies = parser.parse(filepath)
+    # Step 2: drop repeated (ecosystem, name, version) entries - common when
+    # per-service requirements files are concatenated in a monorepo, or the
+    # same package is pinned in several files
+    # Java: LinkedHashMap<Key, Dependency> plus Map<Key, List<String>> for sources
+    unique = {}
+    sources = {}
+    total = 0
+    for path in filepaths:
+        for dep in parsed[path]:
+            total += 1
+            unique.setdefault(dep.key, dep)
+            files = sources.setdefault(dep.key, [])
+            if path not in files:
+                files.append(path)
     
-    if not dependencies:
+    if not unique:
         print("❌ No dependencies found!")
         return None
     
-    print(f"Found {len(dependencies)} dependencies\n")
+    if len(unique) < total:
+        print(f"Found {total} dependencies ({len(unique)} unique)\n")
+    else:
+        print(f"Found {total} dependencies\n")
+    dependencies = list(unique.values())
     
     # Create OSV client (like @Autowired RestTemplate in Spring)
-    osv_client = OSVClient()
+    from api.osv_client import OSVClient
+    osv_client = OSVClient(use_cache=use_cache)
     
-    # Scan each dependency for vulnerabilities
+    # Step 3: query OSV for all dependencies in one batch request
+    # Java: List<List<Vulnerability>> vulns = osvClient.checkBatch(deps);
+    print(f"Checking {len(dependencies)} dependencies against OSV...")
+    batch_vulns = osv_client.check_batch(dependencies, progress=progress, fail_fast=fail_fast)
+    
+    # Count while collecting, so nobody has to walk the results again
     results = []
-    for i, dep in enumerate(dependencies, 1):
-        print(f"Checking {i}/{len(dependencies)}: {dep['name']} {dep['version']}")
-        
-        # Query OSV API
-        # Java: VulnResponse response = osvClient.checkVulnerability(dep);
-        vulns = osv_client.check_vulnerability(
-            package_name=dep['name'],
-            version=dep['version'],
-            ecosystem=dep['ecosystem']
-        )
-        
+    total_vulns = 0
+    for dep, vulns in zip(dependencies, batch_vulns):
         if vulns:
             results.append({
                 'dependency': dep,
-                'vulnerabilities': vulns
+                'vulnerabilities': vulns,
+                'files': sources[dep.key]
             })
+            total_vulns += len(vulns)
+    
+    summary = {
+        'files_scanned': len(filepaths),
+        'total_packages': len(dependencies),
+        'vulnerable_packages': len(results),
+        'total_vulnerabilities': total_vulns,
+        # With --fail-fast, packages after the first hit weren't fully checked
+        'stopped_early': fail_fast and total_vulns > 0
+    }
     
-    return results
+    # Java: return new ScanResult(results, summary);
+    return results, summary
 
-def display_results(results):
+def display_results(results, summary):
     """
     Display scan results to console.
     
@@ -157,13 +257,15 @@ def display_results(results):
         print("✅ No vulnerabilities found!\n")
         return
     
-    # Count totals
-    total_packages = len(results)
-    total_vulns = sum(len(r['vulnerabilities']) for r in results)
-    
-    print(f"Total packages scanned: {total_packages}")
-    print(f"Vulnerable packages: {total_packages}")
-    print(f"Total vulnerabilities: {total_vulns}\n")
+    # Totals were counted during the scan
+    if summary['files_scanned'] > 1:
+        print(f"Files scanned: {summary['files_scanned']}")
+    print(f"Total packages scanned: {summary['total_packages']}")
+    print(f"Vulnerable packages: {summary['vulnerable_packages']}")
+    print(f"Total vulnerabilities: {summary['total_vulnerabilities']}\n")
+    if summary.get('stopped_early'):
+        print("⏹  Stopped at the first vulnerable package (--fail-fast);")
+        print("   packages after it were not fully checked.\n")
     print("⚠️  VULNERABILITIES FOUND:\n")
     
     # Display each vulnerable package
@@ -171,7 +273,11 @@ def display_results(results):
         dep = result['dependency']
         vulns = result['vulnerabilities']
         
-        print(f"  {dep['name']}@{dep['version']}:")
+        # Only worth naming the source file(s) when there was more than one
+        if summary['files_scanned'] > 1:
+            print(f"  {dep.name}@{dep.version} ({', '.join(result['files'])}):")
+        else:
+            print(f"  {dep.name}@{dep.version}:")
         for vuln in vulns:
             severity = vuln.get('severity', 'UNKNOWN')
             vuln_id = vuln.get('id', 'UNKNOWN')
@@ -186,37 +292,54 @@ def main():
     
     Java equivalent: public static void main(String[] args)
     """
+    # Exit quietly when piped into something like "head" that closes early,
+    # instead of raising BrokenPipeError (POSIX only - Windows has no SIGPIPE)
+    if hasattr(signal, 'SIGPIPE'):
+        signal.signal(signal.SIGPIPE, signal.SIG_DFL)
+    
     try:
         # Parse command-line arguments
         args = parse_arguments()
         
-        # Scan the file
-        results = scan_dependencies(args.file)
+        # Scan the file(s)
+        scan = scan_files(args.file, use_cache=not args.no_cache, fail_fast=args.fail_fast)
         
-        if results is None:
+        if scan is None:
             sys.exit(1)
         
-        # Generate report based on format
-        reporter = ReportGenerator()
+        # Tuple unpacking - like destructuring a record
+        results, summary = scan
+        has_vulnerabilities = summary['vulnerable_packages'] > 0
         
+        # Generate report based on format
+        # (text output doesn't need ReportGenerator, so only import it here)
         if args.format == 'text':
-            display_results(results)
+            display_results(results, summary)
         elif args.format == 'json':
-            output = reporter.generate_json(results)
+            from reporters.report import ReportGenerator
+            reporter = ReportGenerator()
+            output = reporter.generate_json(results, summary)
+            # output is already UTF-8 bytes, so write it without re-encoding
             if args.output:
-                Path(args.output).write_text(output)
+                Path(args.output).write_bytes(output)
                 print(f"📄 Report saved to: {args.output}")
             else:
-                print(output)
+                sys.stdout.flush()
+                sys.stdout.buffer.write(output + b"\n")
         elif args.format == 'html':
-            output = reporter.generate_html(results)
+            from reporters.report import ReportGenerator
+            reporter = ReportGenerator()
+            stream = reporter.generate_html(results, summary)
             output_path = args.output or 'vulnerability_report.html'
-            Path(output_path).write_text(output)
+            # Write the page as it renders instead of building it in memory
+            # Java: try (Writer out = Files.newBufferedWriter(path)) { ... }
+            with Path(output_path).open('w', buffering=1 << 20, encoding='utf-8') as f:
+                stream.dump(f)
             print(f"📄 HTML report saved to: {output_path}")
         
         # Exit with error code if vulnerabilities found
         # Java: System.exit(results.isEmpty() ? 0 : 1);
-        sys.exit(1 if results else 0)
+        sys.exit(1 if has_vulnerabilities else 0)
         
     except FileNotFoundError as e:
         print(f"❌ Error: File not found - {e}")